@@ -14,12 +14,89 @@ Examples:
   python compute_expected.py albi SI 40 15
   python compute_expected.py child-pugh 1.5 3.8 1.2 none none
 
+Bulk sweeps (one case per row, columns in CLI argument order):
+  python compute_expected.py adrenal-ct cases.csv
+  python compute_expected.py prostate '[[4, 3, 3.5, 2], [3.5, 2.5, 3, 5.5]]'
+  python compute_expected.py meld-na '[[3.5, 5.0, 2.0, 130, "no"]]'
+A row that cannot be computed yields {"error": ..., "row": <index>} in place.
+
+Batch mode (NDJSON on stdin, one result per line on stdout):
+  echo '{"id": "adrenal-ct", "args": [10, 100, 40]}' | python compute_expected.py --batch
+
+In batch mode results are also memoized in ~/.cache/radulator_qa/expected.json
+(or under $XDG_CACHE_HOME), keeping the most recently used entries; the file
+is dropped whenever this script changes. Set RADULATOR_QA_NO_CACHE=1 to
+bypass it.
+
 Supports all 18 Radulator calculators.
 """
 
+import os
 import sys
+import csv
 import json
 import math
+import atexit
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import radulator_kernels as kernels
+except ImportError:  # imported as scripts.compute_expected
+    from . import radulator_kernels as kernels
+
+
+# Flag values accepted as "yes" on the command line
+_TRUTHY = frozenset({"true", "yes", "1"})
+
+# Child-Pugh lookup tables (keys are lowercase; the CLI parser normalizes input)
+_ASCITES_POINTS = MappingProxyType({"none": 1, "slight": 2, "moderate": 3})
+_ENCEPH_POINTS = MappingProxyType({"none": 1, "grade1-2": 2, "grade3-4": 3})
+_CP_CLASS_BOUNDS = (6, 9)  # Upper total for class A, B
+_CP_CLASSES = (("A", "5-10%"), ("B", "15-20%"), ("C", "45-55%"))
+
+# RENAL Nephrometry lookup tables (keys are lowercase; the CLI parser normalizes input)
+_EXOPHYTIC_POINTS = MappingProxyType({">=50": 1, "<50": 2, "endophytic": 3})
+_NEARNESS_POINTS = MappingProxyType({">=7": 1, "4-7": 2, "<=4": 3})
+_LOCATION_POINTS = MappingProxyType({"above/below": 1, "crosses": 2, "central": 3})
+_RENAL_COMPLEXITY_BOUNDS = (6, 9)  # Upper total for Low, Moderate
+_RENAL_COMPLEXITY = ("Low", "Moderate", "High")
+
+# IPSS severity bands (upper total for Mild, Moderate)
+_IPSS_BOUNDS = (7, 19)
+_IPSS_SEVERITY = (
+    ("Mild", "Watchful waiting"),
+    ("Moderate", "Medical therapy recommended"),
+    ("Severe", "Medical/surgical intervention"),
+)
+
+# SHIM interpretation bands (lower total for each band above Severe)
+_SHIM_BOUNDS = (8, 12, 17, 22)
+_SHIM_INTERPRETATION = (
+    "Severe erectile dysfunction",
+    "Moderate erectile dysfunction",
+    "Mild to moderate erectile dysfunction",
+    "Mild erectile dysfunction",
+    "No erectile dysfunction",
+)
+
+# Display precision applied to float outputs at serialization time
+_PRECISION = {
+    "absolute_washout": 2,
+    "relative_washout": 2,
+    "signal_intensity_index": 2,
+    "chemical_shift_ratio": 3,
+    "volume_cm3": 2,
+    "psa_density": 3,
+    "albi_score": 3,
+    "prescribed_activity_gbq": 2,
+    "tumor_dose_gy": 2,
+    "lung_dose_gy": 2,
+}
+
+# ALBI: 0.66 × log₁₀(x) folded into a natural-log coefficient
+_ALBI_LOG10_COEF = 0.66 / math.log(10)
 
 
 def adrenal_ct_washout(unenh, portal, delayed):
@@ -28,16 +105,11 @@ def adrenal_ct_washout(unenh, portal, delayed):
     Formula: Absolute = ((portal - delayed) / (portal - unenh)) × 100
              Relative = ((portal - delayed) / portal) × 100
     """
-    unenh = float(unenh)
-    portal = float(portal)
-    delayed = float(delayed)
-
-    absolute_washout = ((portal - delayed) / (portal - unenh)) * 100
-    relative_washout = ((portal - delayed) / portal) * 100
+    absolute_washout, relative_washout = kernels.ct_washout(unenh, portal, delayed)
 
     return {
-        "absolute_washout": round(absolute_washout, 2),
-        "relative_washout": round(relative_washout, 2),
+        "absolute_washout": absolute_washout,
+        "relative_washout": relative_washout,
         "suggests_adenoma": absolute_washout >= 60 and relative_washout >= 40
     }
 
@@ -48,15 +120,11 @@ def adrenal_mri_csi(in_phase, out_phase):
     Formula: SII = ((in - out) / in) × 100
              CSR = in / out
     """
-    in_phase = float(in_phase)
-    out_phase = float(out_phase)
-
-    sii = ((in_phase - out_phase) / in_phase) * 100
-    csr = in_phase / out_phase
+    sii, csr = kernels.chemical_shift(in_phase, out_phase)
 
     return {
-        "signal_intensity_index": round(sii, 2),
-        "chemical_shift_ratio": round(csr, 3),
+        "signal_intensity_index": sii,
+        "chemical_shift_ratio": csr,
         "suggests_adenoma": sii > 16.5
     }
 
@@ -67,113 +135,137 @@ def prostate_volume(length, height, width, psa):
     Formula: Volume = length × height × width × 0.52
              PSA Density = PSA / Volume
     """
-    length = float(length)
-    height = float(height)
-    width = float(width)
-    psa = float(psa)
-
-    volume = length * height * width * 0.52
-    psa_density = psa / volume
+    volume, psa_density = kernels.prostate_volume_density(length, height, width, psa)
 
     return {
-        "volume_cm3": round(volume, 2),
-        "psa_density": round(psa_density, 3),
+        "volume_cm3": volume,
+        "psa_density": psa_density,
         "interpretation": "Normal" if psa_density < 0.15 else "Elevated"
     }
 
 
-def albi_score(unit_system, albumin, bilirubin):
+def _columns(*cols):
+    """Coerce input columns to lists of floats."""
+    return [[float(v) for v in col] for col in cols]
+
+
+def adrenal_ct_washout_vec(unenh, portal, delayed):
     """
-    ALBI Score (Albumin-Bilirubin Grade)
-    Formula: (log₁₀ bilirubin [μmol/L] × 0.66) + (albumin [g/L] × −0.0852)
-    Grading: Grade 1: ≤−2.60; Grade 2: >−2.60 to ≤−1.39; Grade 3: >−1.39
+    Column-wise Adrenal CT Washout for bulk QA sweeps.
+    Takes one sequence per input and returns one list per output key.
     """
-    albumin = float(albumin)
-    bilirubin = float(bilirubin)
+    washouts = [kernels.ct_washout(*row) for row in zip(*_columns(unenh, portal, delayed))]
+
+    return {
+        "absolute_washout": [a for a, _ in washouts],
+        "relative_washout": [r for _, r in washouts],
+        "suggests_adenoma": [a >= 60 and r >= 40 for a, r in washouts]
+    }
 
-    # Convert to SI units if needed
-    if unit_system.upper() == "US":
-        bili_si = bilirubin * 17.104  # mg/dL → μmol/L
-        alb_si = albumin * 10         # g/dL → g/L
-    else:
-        bili_si = bilirubin
-        alb_si = albumin
 
-    # Calculate ALBI score
-    score = (math.log10(bili_si) * 0.66) + (alb_si * -0.0852)
+def adrenal_mri_csi_vec(in_phase, out_phase):
+    """
+    Column-wise Adrenal MRI Chemical Shift Index for bulk QA sweeps.
+    """
+    shifts = [kernels.chemical_shift(*row) for row in zip(*_columns(in_phase, out_phase))]
+
+    return {
+        "signal_intensity_index": [sii for sii, _ in shifts],
+        "chemical_shift_ratio": [csr for _, csr in shifts],
+        "suggests_adenoma": [sii > 16.5 for sii, _ in shifts]
+    }
 
-    # Determine grade
+
+def prostate_volume_vec(length, height, width, psa):
+    """
+    Column-wise Prostate Volume & PSA Density for bulk QA sweeps.
+    """
+    volumes = [
+        kernels.prostate_volume_density(*row)
+        for row in zip(*_columns(length, height, width, psa))
+    ]
+
+    return {
+        "volume_cm3": [v for v, _ in volumes],
+        "psa_density": [d for _, d in volumes],
+        "interpretation": ["Normal" if d < 0.15 else "Elevated" for _, d in volumes]
+    }
+
+
+def _albi_kernel(bili_si, alb_si):
+    """ALBI linear score from SI inputs (bilirubin μmol/L, albumin g/L)."""
+    return (math.log(bili_si) * _ALBI_LOG10_COEF) + (alb_si * -0.0852)
+
+
+def _albi_grade(score):
+    """Map an ALBI score to (grade, interpretation)."""
     if score <= -2.60:
-        grade = 1
-        interpretation = "Best liver function - well-compensated"
+        return 1, "Best liver function - well-compensated"
     elif score <= -1.39:
-        grade = 2
-        interpretation = "Intermediate liver function - moderately compensated"
-    else:
-        grade = 3
-        interpretation = "Worst liver function - poorly compensated"
+        return 2, "Intermediate liver function - moderately compensated"
+    return 3, "Worst liver function - poorly compensated"
+
+
+def _albi_si(unit_system, albumin, bilirubin):
+    """Convert albumin/bilirubin to SI units; returns (bili_si, alb_si)."""
+    if unit_system.upper() == "US":
+        return bilirubin * 17.104, albumin * 10  # mg/dL → μmol/L, g/dL → g/L
+    return bilirubin, albumin
+
+
+def albi_score(unit_system, albumin, bilirubin):
+    """
+    ALBI Score (Albumin-Bilirubin Grade)
+    Formula: (log₁₀ bilirubin [μmol/L] × 0.66) + (albumin [g/L] × −0.0852)
+    Grading: Grade 1: ≤−2.60; Grade 2: >−2.60 to ≤−1.39; Grade 3: >−1.39
+    """
+    bili_si, alb_si = _albi_si(unit_system, albumin, bilirubin)
+    score = _albi_kernel(bili_si, alb_si)
+    grade, interpretation = _albi_grade(score)
 
     return {
-        "albi_score": round(score, 3),
+        "albi_score": score,
         "albi_grade": grade,
         "interpretation": interpretation
     }
 
 
+def albi_score_vec(unit_system, albumin, bilirubin):
+    """
+    Column-wise ALBI Score for bulk QA sweeps.
+    """
+    albumin, bilirubin = _columns(albumin, bilirubin)
+
+    scores = [
+        _albi_kernel(*_albi_si(u, a, b))
+        for u, a, b in zip(unit_system, albumin, bilirubin)
+    ]
+    grades = [_albi_grade(score) for score in scores]
+
+    return {
+        "albi_score": scores,
+        "albi_grade": [g for g, _ in grades],
+        "interpretation": [i for _, i in grades]
+    }
+
+
 def child_pugh(bilirubin, albumin, inr, ascites, encephalopathy):
     """
     Child-Pugh Score
     Scoring: Each parameter 1-3 points
     Classes: A (5-6), B (7-9), C (10-15)
     """
-    bili = float(bilirubin)
-    alb = float(albumin)
-    inr_val = float(inr)
-
-    # Bilirubin points
-    if bili < 2.0:
-        bili_pts = 1
-    elif bili <= 3.0:
-        bili_pts = 2
-    else:
-        bili_pts = 3
-
-    # Albumin points
-    if alb > 3.5:
-        alb_pts = 1
-    elif alb >= 2.8:
-        alb_pts = 2
-    else:
-        alb_pts = 3
-
-    # INR points
-    if inr_val < 1.7:
-        inr_pts = 1
-    elif inr_val <= 2.2:
-        inr_pts = 2
-    else:
-        inr_pts = 3
-
-    # Ascites points
-    ascites_map = {"none": 1, "slight": 2, "moderate": 3}
-    ascites_pts = ascites_map.get(ascites.lower(), 1)
-
-    # Encephalopathy points
-    enceph_map = {"none": 1, "grade1-2": 2, "grade3-4": 3}
-    enceph_pts = enceph_map.get(encephalopathy.lower(), 1)
+    # Points per lab value: 1 + one for each threshold crossed
+    bili_pts = 1 + (bilirubin >= 2.0) + (bilirubin > 3.0)
+    alb_pts = 1 + (albumin <= 3.5) + (albumin < 2.8)
+    inr_pts = 1 + (inr >= 1.7) + (inr > 2.2)
+
+    ascites_pts = _ASCITES_POINTS.get(ascites, 1)
+    enceph_pts = _ENCEPH_POINTS.get(encephalopathy, 1)
 
     total = bili_pts + alb_pts + inr_pts + ascites_pts + enceph_pts
 
-    # Determine class
-    if total <= 6:
-        cp_class = "A"
-        mortality_1yr = "5-10%"
-    elif total <= 9:
-        cp_class = "B"
-        mortality_1yr = "15-20%"
-    else:
-        cp_class = "C"
-        mortality_1yr = "45-55%"
+    cp_class, mortality_1yr = _CP_CLASSES[bisect_left(_CP_CLASS_BOUNDS, total)]
 
     return {
         "total_score": total,
@@ -182,18 +274,11 @@ def child_pugh(bilirubin, albumin, inr, ascites, encephalopathy):
     }
 
 
-def meld_na(creatinine, bilirubin, inr, sodium, dialysis):
+def _meld_na_kernel(cr, bili, inr, na, on_dialysis):
     """
-    MELD-Na Score
-    Formula: MELD = [0.957×ln(Cr) + 0.378×ln(Bili) + 1.120×ln(INR) + 0.643] × 10
-             MELD-Na = MELD + 1.32×(137-Na) - [0.033×MELD×(137-Na)]
+    MELD / MELD-Na arithmetic on numeric inputs.
+    Returns (meld, meld_na) as integers capped to 6-40.
     """
-    cr = float(creatinine)
-    bili = float(bilirubin)
-    inr_val = float(inr)
-    na = float(sodium)
-    on_dialysis = str(dialysis).lower() in ['true', 'yes', '1']
-
     # Apply creatinine adjustments
     adjusted_cr = max(cr, 1.0)  # Lower bound
     if on_dialysis:
@@ -203,7 +288,7 @@ def meld_na(creatinine, bilirubin, inr, sodium, dialysis):
 
     # Apply other lower bounds
     adjusted_bili = max(bili, 1.0)
-    adjusted_inr = max(inr_val, 1.0)
+    adjusted_inr = max(inr, 1.0)
 
     # Calculate MELD score
     meld_raw = (0.957 * math.log(adjusted_cr) +
@@ -223,22 +308,37 @@ def meld_na(creatinine, bilirubin, inr, sodium, dialysis):
         meld_na = round(meld_na)
         meld_na = max(6, min(40, meld_na))
 
-    # Determine mortality risk
+    return meld, meld_na
+
+
+def _meld_na_risk(meld_na):
+    """Map a MELD-Na score to (3-month mortality, risk category)."""
     if meld_na <= 9:
-        mortality = "1.9%"
-        risk = "Low risk"
+        return "1.9%", "Low risk"
     elif meld_na <= 19:
-        mortality = "6.0%"
-        risk = "Moderate risk"
+        return "6.0%", "Moderate risk"
     elif meld_na <= 29:
-        mortality = "19.6%"
-        risk = "High risk"
+        return "19.6%", "High risk"
     elif meld_na <= 39:
-        mortality = "52.6%"
-        risk = "Very high risk"
-    else:
-        mortality = ">70%"
-        risk = "Critical risk"
+        return "52.6%", "Very high risk"
+    return ">70%", "Critical risk"
+
+
+def _is_truthy(value):
+    """Interpret CLI yes/no style flags."""
+    return str(value).lower() in _TRUTHY
+
+
+def meld_na(creatinine, bilirubin, inr, sodium, dialysis):
+    """
+    MELD-Na Score
+    Formula: MELD = [0.957×ln(Cr) + 0.378×ln(Bili) + 1.120×ln(INR) + 0.643] × 10
+             MELD-Na = MELD + 1.32×(137-Na) - [0.033×MELD×(137-Na)]
+    """
+    on_dialysis = _is_truthy(dialysis)
+
+    meld, meld_na = _meld_na_kernel(creatinine, bilirubin, inr, sodium, on_dialysis)
+    mortality, risk = _meld_na_risk(meld_na)
 
     return {
         "meld_score": meld,
@@ -248,30 +348,32 @@ def meld_na(creatinine, bilirubin, inr, sodium, dialysis):
     }
 
 
-def ipss(*args):
+def meld_na_vec(creatinine, bilirubin, inr, sodium, dialysis):
     """
-    IPSS (International Prostate Symptom Score)
-    Score: Sum of Q1-Q7 (0-35)
-    QoL: Q8 (0-6)
+    Column-wise MELD-Na Score for bulk QA sweeps.
     """
-    if len(args) < 7:
-        return {"error": "IPSS requires 7 questions (Q1-Q7), optional Q8"}
+    cr, bili, inr_val, na = _columns(creatinine, bilirubin, inr, sodium)
+
+    scores = [
+        _meld_na_kernel(c, b, i, n, _is_truthy(d))
+        for c, b, i, n, d in zip(cr, bili, inr_val, na, dialysis)
+    ]
+    risks = [_meld_na_risk(m_na) for _, m_na in scores]
 
-    scores = [int(x) for x in args[:7]]
-    total = sum(scores)
+    return {
+        "meld_score": [m for m, _ in scores],
+        "meld_na_score": [m_na for _, m_na in scores],
+        "mortality_3mo": [mortality for mortality, _ in risks],
+        "risk_category": [risk for _, risk in risks]
+    }
 
-    qol = int(args[7]) if len(args) > 7 else None
 
-    # Determine severity
-    if total <= 7:
-        severity = "Mild"
-        management = "Watchful waiting"
-    elif total <= 19:
-        severity = "Moderate"
-        management = "Medical therapy recommended"
-    else:
-        severity = "Severe"
-        management = "Medical/surgical intervention"
+def ipss7(q1, q2, q3, q4, q5, q6, q7, qol=None):
+    """
+    IPSS on already-parsed integer answers (Q1-Q7, optional QoL Q8)
+    """
+    total = q1 + q2 + q3 + q4 + q5 + q6 + q7
+    severity, management = _IPSS_SEVERITY[bisect_left(_IPSS_BOUNDS, total)]
 
     result = {
         "total_score": total,
@@ -285,34 +387,41 @@ def ipss(*args):
     return result
 
 
-def shim(*args):
+def ipss(*args):
     """
-    SHIM Score (Sexual Health Inventory for Men / IIEF-5)
-    Score range: 5-25
+    IPSS (International Prostate Symptom Score)
+    Score: Sum of Q1-Q7 (0-35)
+    QoL: Q8 (0-6)
     """
-    if len(args) < 5:
-        return {"error": "SHIM requires 5 questions"}
+    if len(args) < 7:
+        return {"error": "IPSS requires 7 questions (Q1-Q7), optional Q8"}
 
-    scores = [int(x) for x in args[:5]]
-    total = sum(scores)
+    return ipss7(*args[:8])
 
-    if total >= 22:
-        interpretation = "No erectile dysfunction"
-    elif total >= 17:
-        interpretation = "Mild erectile dysfunction"
-    elif total >= 12:
-        interpretation = "Mild to moderate erectile dysfunction"
-    elif total >= 8:
-        interpretation = "Moderate erectile dysfunction"
-    else:
-        interpretation = "Severe erectile dysfunction"
+
+def shim5(q1, q2, q3, q4, q5):
+    """
+    SHIM on already-parsed integer answers (Q1-Q5)
+    """
+    total = q1 + q2 + q3 + q4 + q5
 
     return {
         "total_score": total,
-        "interpretation": interpretation
+        "interpretation": _SHIM_INTERPRETATION[bisect_right(_SHIM_BOUNDS, total)]
     }
 
 
+def shim(*args):
+    """
+    SHIM Score (Sexual Health Inventory for Men / IIEF-5)
+    Score range: 5-25
+    """
+    if len(args) < 5:
+        return {"error": "SHIM requires 5 questions"}
+
+    return shim5(*args[:5])
+
+
 def renal_nephrometry(radius, exophytic, nearness, polar, hilar="no"):
     """
     RENAL Nephrometry Score
@@ -321,39 +430,15 @@ def renal_nephrometry(radius, exophytic, nearness, polar, hilar="no"):
     N (nearness): ≥7mm=1, 4-7mm=2, ≤4mm=3
     L (location): above/below=1, crosses=2, central=3
     """
-    r = float(radius)
-
-    # R points
-    if r <= 4:
-        r_pts = 1
-    elif r < 7:
-        r_pts = 2
-    else:
-        r_pts = 3
-
-    # E points
-    exo_map = {">=50": 1, "<50": 2, "endophytic": 3}
-    e_pts = exo_map.get(str(exophytic).lower(), 2)
-
-    # N points
-    near_map = {">=7": 1, "4-7": 2, "<=4": 3}
-    n_pts = near_map.get(str(nearness), 1)
-
-    # L points
-    polar_map = {"above/below": 1, "crosses": 2, "central": 3}
-    l_pts = polar_map.get(str(polar).lower(), 1)
+    r_pts = 1 + (radius > 4) + (radius >= 7)
+    e_pts = _EXOPHYTIC_POINTS.get(exophytic, 2)
+    n_pts = _NEARNESS_POINTS.get(nearness, 1)
+    l_pts = _LOCATION_POINTS.get(polar, 1)
 
     total = r_pts + e_pts + n_pts + l_pts
+    complexity = _RENAL_COMPLEXITY[bisect_left(_RENAL_COMPLEXITY_BOUNDS, total)]
 
-    # Complexity
-    if total <= 6:
-        complexity = "Low"
-    elif total <= 9:
-        complexity = "Moderate"
-    else:
-        complexity = "High"
-
-    is_hilar = str(hilar).lower() in ['true', 'yes', '1']
+    is_hilar = _is_truthy(hilar)
 
     return {
         "renal_score": total,
@@ -369,10 +454,8 @@ def milan_criteria(tumor_count, tumor1_size, macrovascular="no", extrahepatic="n
     Milan: Single ≤5cm OR 2-3 ≤3cm each
     UCSF: Single ≤6.5cm OR 2-3 with largest ≤4.5cm and total ≤8cm
     """
-    count = int(tumor_count)
-    t1 = float(tumor1_size)
-    macro = str(macrovascular).lower() in ['yes', 'true', '1']
-    extra = str(extrahepatic).lower() in ['yes', 'true', '1']
+    macro = _is_truthy(macrovascular)
+    extra = _is_truthy(extrahepatic)
 
     # Automatic exclusion criteria
     if macro or extra:
@@ -383,7 +466,7 @@ def milan_criteria(tumor_count, tumor1_size, macrovascular="no", extrahepatic="n
         }
 
     # Check tumor count
-    if count >= 4:
+    if tumor_count >= 4:
         return {
             "milan_criteria": "EXCEEDS",
             "ucsf_criteria": "EXCEEDS",
@@ -391,98 +474,104 @@ def milan_criteria(tumor_count, tumor1_size, macrovascular="no", extrahepatic="n
         }
 
     # Single tumor
-    if count == 1:
-        milan = "WITHIN" if t1 <= 5 else "EXCEEDS"
-        ucsf = "WITHIN" if t1 <= 6.5 else "EXCEEDS"
+    if tumor_count == 1:
+        milan = "WITHIN" if tumor1_size <= 5 else "EXCEEDS"
+        ucsf = "WITHIN" if tumor1_size <= 6.5 else "EXCEEDS"
 
         return {
             "milan_criteria": milan,
             "ucsf_criteria": ucsf,
             "tumor_count": 1,
-            "largest_tumor": t1
+            "largest_tumor": tumor1_size
         }
 
     # Multiple tumors (2-3)
-    tumors = [t1]
-    if tumor2_size:
-        tumors.append(float(tumor2_size))
-    if tumor3_size:
-        tumors.append(float(tumor3_size))
+    # Fixed-width sizes; an absent tumor counts as 0 and never changes a result
+    sizes = (tumor1_size, tumor2_size or 0.0, tumor3_size or 0.0)
 
-    largest = max(tumors)
-    all_le_3 = all(t <= 3 for t in tumors)
-    total_diameter = sum(tumors)
+    largest = max(sizes)
+    total_diameter = sum(sizes)
+    all_le_3 = largest <= 3
 
     # Milan: 2-3 tumors all ≤3cm
-    milan = "WITHIN" if all_le_3 and count <= 3 else "EXCEEDS"
+    milan = "WITHIN" if all_le_3 and tumor_count <= 3 else "EXCEEDS"
 
     # UCSF: largest ≤4.5cm AND total ≤8cm
-    ucsf = "WITHIN" if (largest <= 4.5 and total_diameter <= 8 and count <= 3) else "EXCEEDS"
+    ucsf = "WITHIN" if (largest <= 4.5 and total_diameter <= 8 and tumor_count <= 3) else "EXCEEDS"
 
     return {
         "milan_criteria": milan,
         "ucsf_criteria": ucsf,
-        "tumor_count": count,
+        "tumor_count": tumor_count,
         "largest_tumor": largest,
         "total_diameter": total_diameter
     }
 
 
-def y90_segmentectomy(model, segment_vol, target_dose, lsf, tumor_vol=None, tn_ratio=None):
-    """
-    Y-90 Radiation Segmentectomy Dosimetry
-    MIRD: A [GBq] = (D [Gy] × M [kg] × (1-LSF)) / 49.67
-    Partition: A [GBq] = (D_N × M_N × (T/N + 1) × (1-LSF)) / 49.67
-    """
-    seg_vol = float(segment_vol)  # mL
-    target_d = float(target_dose)  # Gy
-    lsf_val = float(lsf) / 100  # Convert % to fraction
+def _y90_mird(seg_vol, target_d, lsf_val, tumor_vol, tn_ratio):
+    """MIRD model: uniform dose across the segment."""
+    seg_mass = seg_vol / 1000  # mL → kg (assume density = 1.0 g/mL)
 
-    # Convert mL to kg (assume density = 1.0 g/mL)
-    seg_mass = seg_vol / 1000  # kg
+    activity_gbq = (target_d * seg_mass * (1 - lsf_val)) / 49.67
+    lung_dose = (49.67 * activity_gbq * lsf_val) / 1.0
 
-    if model.lower() == "mird":
-        # MIRD model: uniform dose
-        activity_gbq = (target_d * seg_mass * (1 - lsf_val)) / 49.67
-        lung_dose = (49.67 * activity_gbq * lsf_val) / 1.0
+    return {
+        "prescribed_activity_gbq": activity_gbq,
+        "lung_dose_gy": lung_dose,
+        "model": "MIRD",
+        "safe": lung_dose < 30
+    }
 
-        return {
-            "prescribed_activity_gbq": round(activity_gbq, 2),
-            "lung_dose_gy": round(lung_dose, 2),
-            "model": "MIRD",
-            "safe": lung_dose < 30
-        }
 
-    elif model.lower() == "partition":
-        # Partition model
-        if tumor_vol is None or tn_ratio is None:
-            return {"error": "Partition model requires tumor_vol and tn_ratio"}
+def _y90_partition(seg_vol, target_d, lsf_val, tumor_vol, tn_ratio):
+    """Partition model: requires tumor volume and tumor/normal ratio."""
+    if tumor_vol is None or tn_ratio is None:
+        return {"error": "Partition model requires tumor_vol and tn_ratio"}
 
-        tum_vol = float(tumor_vol)
-        tn = float(tn_ratio)
+    seg_mass = seg_vol / 1000  # mL → kg (assume density = 1.0 g/mL)
 
-        normal_vol = seg_vol - tum_vol
-        normal_mass = normal_vol / 1000
+    normal_vol = seg_vol - tumor_vol
+    normal_mass = normal_vol / 1000
 
-        # Simplified partition calculation
-        # Activity needed to achieve target tumor dose
-        activity_gbq = (target_d * seg_mass * (1 - lsf_val)) / 49.67
+    # Simplified partition calculation
+    # Activity needed to achieve target tumor dose
+    activity_gbq = (target_d * seg_mass * (1 - lsf_val)) / 49.67
 
-        lung_dose = (49.67 * activity_gbq * lsf_val) / 1.0
+    lung_dose = (49.67 * activity_gbq * lsf_val) / 1.0
 
-        return {
-            "prescribed_activity_gbq": round(activity_gbq, 2),
-            "tumor_dose_gy": round(target_d, 2),
-            "lung_dose_gy": round(lung_dose, 2),
-            "model": "Partition",
-            "safe": lung_dose < 30
-        }
+    return {
+        "prescribed_activity_gbq": activity_gbq,
+        "tumor_dose_gy": target_d,
+        "lung_dose_gy": lung_dose,
+        "model": "Partition",
+        "safe": lung_dose < 30
+    }
+
+
+# Y-90 dosimetry models by lowercase name
+_Y90_MODELS = MappingProxyType({
+    "mird": _y90_mird,
+    "partition": _y90_partition,
+})
+
+
+def y90_segmentectomy(model, segment_vol, target_dose, lsf, tumor_vol=None, tn_ratio=None):
+    """
+    Y-90 Radiation Segmentectomy Dosimetry
+    MIRD: A [GBq] = (D [Gy] × M [kg] × (1-LSF)) / 49.67
+    Partition: A [GBq] = (D_N × M_N × (T/N + 1) × (1-LSF)) / 49.67
+    """
+    lsf_val = lsf / 100  # Convert % to fraction
 
-    return {"error": "Unknown model. Use 'mird' or 'partition'"}
+    model_fn = _Y90_MODELS.get(model)
+    if model_fn is None:
+        return {"error": "Unknown model. Use 'mird' or 'partition'"}
 
+    return model_fn(segment_vol, target_dose, lsf_val, tumor_vol, tn_ratio)
 
-# Calculator registry
-CALCULATORS = {
+
+# Calculator registry (read-only once built)
+CALCULATORS = MappingProxyType({
     "adrenal-ct": adrenal_ct_washout,
     "adrenal-mri": adrenal_mri_csi,
     "prostate": prostate_volume,
@@ -494,14 +583,346 @@ CALCULATORS = {
     "renal-nephrometry": renal_nephrometry,
     "milan": milan_criteria,
     "y90": y90_segmentectomy,
-}
+})
+
+# Typed command-line arguments per calculator, in call order:
+# (name, type) or (name, type, nargs[, default])
+CALCULATOR_ARGS = MappingProxyType({
+    "adrenal-ct": (("unenh", float), ("portal", float), ("delayed", float)),
+    "adrenal-mri": (("in_phase", float), ("out_phase", float)),
+    "prostate": (("length", float), ("height", float), ("width", float), ("psa", float)),
+    "albi": (("unit_system", str), ("albumin", float), ("bilirubin", float)),
+    "child-pugh": (
+        ("bilirubin", float), ("albumin", float), ("inr", float),
+        ("ascites", str.lower), ("encephalopathy", str.lower),
+    ),
+    "meld-na": (
+        ("creatinine", float), ("bilirubin", float), ("inr", float),
+        ("sodium", float), ("dialysis", str),
+    ),
+    "ipss": (("answers", int, "*"),),
+    "shim": (("answers", int, "*"),),
+    "renal-nephrometry": (
+        ("radius", float), ("exophytic", str.lower), ("nearness", str), ("polar", str.lower),
+        ("hilar", str, "?", "no"),
+    ),
+    "milan": (
+        ("tumor_count", int), ("tumor1_size", float),
+        ("macrovascular", str, "?", "no"), ("extrahepatic", str, "?", "no"),
+        ("tumor2_size", float, "?", None), ("tumor3_size", float, "?", None),
+    ),
+    "y90": (
+        ("model", str.lower), ("segment_vol", float), ("target_dose", float), ("lsf", float),
+        ("tumor_vol", float, "?", None), ("tn_ratio", float, "?", None),
+    ),
+})
+
+
+def _optional(type_, default):
+    """Wrap type_ so a blank value (CLI "" or NDJSON null) yields the default."""
+    def convert(value):
+        return default if value is None or value == "" else type_(value)
+    convert.__name__ = type_.__name__
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _parser(only=None):
+    """
+    Build the CLI parser on first use: one subcommand per calculator, with
+    positionals typed from CALCULATOR_ARGS. A single CLI run only needs the
+    subcommand named by only; batch mode never needs the parser at all.
+    """
+    import argparse
+
+    class _ArgumentParser(argparse.ArgumentParser):
+        """ArgumentParser that raises instead of exiting, so errors stay JSON."""
+
+        def error(self, message):
+            raise ValueError(message)
+
+    parser = _ArgumentParser(
+        prog="compute_expected.py",
+        description="Compute expected values for Radulator calculators.",
+    )
+    sub = parser.add_subparsers(dest="calc", required=True)
+    for calc_id, spec in CALCULATOR_ARGS.items():
+        if only is not None and calc_id != only:
+            continue
+        p = sub.add_parser(calc_id, help=CALCULATORS[calc_id].__doc__.strip().splitlines()[0])
+        for name, type_, *rest in spec:
+            nargs, default = (rest + [None, None])[:2]
+            if nargs == "?":
+                type_ = _optional(type_, default)
+            p.add_argument(name, type=type_, nargs=nargs, default=default)
+    return parser
+
+
+def _convert(name, type_, value):
+    """Convert one CLI string or decoded NDJSON value to type_, with argparse-style errors."""
+    try:
+        if type_ is float:
+            return float(value)
+        if type_ is int:
+            return value if type(value) is int else int(str(value))
+        return type_(str(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"argument {name}: invalid {type_.__name__} value: {value!r}") from None
+
+
+def convert_args(calc_id, args):
+    """
+    Convert CLI strings or decoded NDJSON arguments for calc_id straight to
+    typed positional values using CALCULATOR_ARGS, without argparse.
+    """
+    args = list(args)
+    values = []
+    missing = []
+    for name, type_, *rest in CALCULATOR_ARGS[calc_id]:
+        nargs, default = (rest + [None, None])[:2]
+        if nargs == "*":
+            values.extend(_convert(name, type_, v) for v in args)
+            args = []
+        elif not args:
+            if nargs == "?":
+                values.append(default)
+            else:
+                missing.append(name)
+        else:
+            value = args.pop(0)
+            if nargs == "?" and (value is None or value == ""):
+                values.append(default)
+            else:
+                values.append(_convert(name, type_, value))
+
+    if missing:
+        raise ValueError(f"the following arguments are required: {', '.join(missing)}")
+    if args:
+        raise ValueError(f"unrecognized arguments: {' '.join(map(str, args))}")
+    return tuple(values)
+
+
+def parse_args(calc_id, args):
+    """
+    Parse command-line argument strings for calc_id into typed positional
+    values. argparse is only loaded to print -h/--help; values such as -1e-7
+    are ordinary numbers.
+    """
+    if list(args) in (["-h"], ["--help"]):
+        _parser(calc_id).parse_args([calc_id, "--help"])
+    return convert_args(calc_id, args)
+
+
+# Column-wise variants used for bulk (CSV / JSON array) input
+VECTORIZED = MappingProxyType({
+    "adrenal-ct": adrenal_ct_washout_vec,
+    "adrenal-mri": adrenal_mri_csi_vec,
+    "prostate": prostate_volume_vec,
+    "albi": albi_score_vec,
+    "meld-na": meld_na_vec,
+})
+
+
+def _is_bulk_input(args):
+    """True when the only argument is a CSV/JSON file or a JSON array literal."""
+    if len(args) != 1:
+        return False
+    arg = args[0]
+    return arg.lower().endswith((".csv", ".json")) or arg.lstrip().startswith("[")
+
+
+def _is_header(calc_id, row):
+    """True when a numeric column of the first CSV row does not parse as a number."""
+    for (_, type_, *_), cell in zip(CALCULATOR_ARGS[calc_id], row):
+        if type_ in (float, int):
+            try:
+                float(cell)
+            except ValueError:
+                return True
+    return False
+
+
+def _load_rows(calc_id, source):
+    """Load case rows from a CSV file, JSON file, or JSON array literal."""
+    if source.lower().endswith(".csv"):
+        with open(source, newline="") as f:
+            rows = [row for row in csv.reader(f) if row]
+        # Skip a header row if present
+        if rows and _is_header(calc_id, rows[0]):
+            rows = rows[1:]
+        return rows
+
+    if source.lower().endswith(".json"):
+        with open(source) as f:
+            return json.load(f)
+
+    return json.loads(source)
+
+
+def _run_columns(calc_id, rows):
+    """Transpose rows, run the column-wise kernel, and split the result back into rows."""
+    result = VECTORIZED[calc_id](*zip(*rows))
+    return [dict(zip(result, values)) for values in zip(*result.values())]
+
+
+def run_bulk(calc_id, source):
+    """
+    Run every case row through the column-wise kernel; returns one result per
+    row. A row of the wrong length, or one the kernel rejects, becomes
+    {"error": ..., "row": index} without affecting the other rows.
+    """
+    rows = _load_rows(calc_id, source)
+    width = len(CALCULATOR_ARGS[calc_id])
+    results = [None] * len(rows)
+    valid = []
+    for i, row in enumerate(rows):
+        if isinstance(row, list) and len(row) == width:
+            valid.append(i)
+        else:
+            got = len(row) if isinstance(row, list) else 1
+            results[i] = {"error": f"Expected {width} values, got {got}", "row": i}
+
+    if valid:
+        try:
+            computed = _run_columns(calc_id, [rows[i] for i in valid])
+        except Exception:
+            # Re-run one row at a time to find the rows that fail
+            computed = []
+            for i in valid:
+                try:
+                    computed.extend(_run_columns(calc_id, [rows[i]]))
+                except Exception as e:
+                    computed.append({"error": str(e), "row": i})
+        for i, result in zip(valid, computed):
+            results[i] = result
+    return results
+
+
+# On-disk cache of expected values, keyed by "<calc-id>|<arg>|..."
+_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "radulator_qa",
+    "expected.json",
+)
+_DISK_CACHE_MAX = 4096  # Entries kept; least recently used are evicted
+_disk_cache = None
+_disk_cache_dirty = False
+_fingerprint = None
+
+
+def _source_fingerprint():
+    """Hash of this script and its kernels, so cached values never outlive a formula change."""
+    import hashlib
+
+    digest = hashlib.sha1()
+    for path in (__file__, kernels.__file__):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_disk_cache():
+    """Load the persistent cache once per process (batch mode only); returns its entries dict."""
+    global _disk_cache, _fingerprint
+    if _disk_cache is None:
+        _disk_cache = {}
+        _fingerprint = _source_fingerprint()
+        try:
+            with open(_CACHE_PATH) as f:
+                stored = json.load(f)
+            if stored.get("fingerprint") == _fingerprint:
+                _disk_cache = stored.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        atexit.register(_save_disk_cache)
+    return _disk_cache
+
+
+def _save_disk_cache():
+    """Write the cache back if this process added entries."""
+    if not _disk_cache_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"fingerprint": _fingerprint, "entries": _disk_cache}, f)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1024)
+def _compute_uncached(calc_id, args):
+    """In-process memo layer; args must be a hashable tuple."""
+    return CALCULATORS[calc_id](*args)
+
+
+def compute(calc_id, args):
+    """
+    Expected result for calculator calc_id on args, memoized in-process and,
+    once _load_disk_cache() has run, on disk. Calculators are pure, so a hit
+    is always valid for this source.
+    """
+    global _disk_cache_dirty
+    args = tuple(args)
+    cache = _disk_cache
+    if cache is None:
+        return _compute_uncached(calc_id, args)
+
+    key = "|".join((calc_id, *map(str, args)))
+    result = cache.pop(key, None)
+    if result is None:
+        result = _compute_uncached(calc_id, args)
+        if "error" in result:
+            return result
+        while len(cache) >= _DISK_CACHE_MAX:
+            del cache[next(iter(cache))]
+        _disk_cache_dirty = True
+
+    # Re-insert so dict order tracks recency; a hit alone does not
+    # rewrite the file, the new order is saved with the next insert
+    cache[key] = result
+    return result
+
+
+def run_batch(stream_in, stream_out):
+    """
+    Evaluate NDJSON requests of the form {"id": <calculator-id>, "args": [...]}
+    in-process, writing one JSON result per input line. Errors are reported
+    per line so one bad case does not abort the sweep.
+    """
+    if not os.environ.get("RADULATOR_QA_NO_CACHE"):
+        _load_disk_cache()
+
+    for line in stream_in:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            calc_id = str(req["id"]).lower()
+            if calc_id in CALCULATORS:
+                out = compute(calc_id, convert_args(calc_id, req.get("args", [])))
+            else:
+                out = {"error": f"Unknown calculator: {calc_id}"}
+        except Exception as e:
+            out = {"error": str(e)}
+        stream_out.write(kernels.dumps(out, precision=_PRECISION) + "\n")
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        run_batch(sys.stdin, sys.stdout)
+        return
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python compute_expected.py <calculator-id> <args...>"}))
         sys.exit(1)
 
+    if sys.argv[1] in ("-h", "--help"):
+        _parser().print_help()
+        return
+
     calc_id = sys.argv[1].lower()
     args = sys.argv[2:]
 
@@ -513,9 +934,11 @@ def main():
         sys.exit(1)
 
     try:
-        calc_func = CALCULATORS[calc_id]
-        result = calc_func(*args)
-        print(json.dumps(result, indent=2))
+        if calc_id in VECTORIZED and _is_bulk_input(args):
+            result = run_bulk(calc_id, args[0])
+        else:
+            result = compute(calc_id, parse_args(calc_id, args))
+        print(kernels.dumps(result, indent=True, precision=_PRECISION))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
         sys.exit(1)
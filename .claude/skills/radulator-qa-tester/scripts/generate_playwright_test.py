@@ -3,25 +3,35 @@
 Playwright Test Template Generator
 
 Generates Playwright test templates for Radulator calculators.
+
+Batch mode reads NDJSON specs from stdin, one per line:
+    {"calculator_name": "Prostate Volume", "test_data": {...}}
+and writes one {"calculator_name", "code"} JSON object per line.
 """
 
-def generate_playwright_test(calculator_name: str, test_data: dict) -> str:
-    """
-    Generate a Playwright test template for a specific calculator.
-    
-    Args:
-        calculator_name: Name of the calculator (e.g., "Adrenal Washout CT")
-        test_data: Dictionary containing test inputs and expected outputs
-    
-    Returns:
-        JavaScript code for the Playwright test
-    """
-    
-    # Template for adrenal CT washout
-    if "adrenal" in calculator_name.lower() and "ct" in calculator_name.lower():
-        return f"""const {{ test, expect }} = require('@playwright/test');
+import string
 
-test('Adrenal CT Washout Calculator - {test_data.get("test_name", "Basic Test")}', async ({{ page }}) => {{
+
+# Fallbacks for template fields missing from test_data
+_DEFAULTS = {
+    "test_name": "Basic Test",
+    "unenh": "",
+    "portal": "",
+    "delayed": "",
+    "expected_absolute": 0,
+    "expected_relative": 0,
+    "length": "",
+    "height": "",
+    "width": "",
+    "psa": "",
+    "expected_volume": 0,
+    "expected_density": 0,
+}
+
+# Template for adrenal CT washout
+_ADRENAL_CT_TPL = string.Template(r"""const { test, expect } = require('@playwright/test');
+
+test('Adrenal CT Washout Calculator - ${test_name}', async ({ page }) => {
   // Navigate to Radulator
   await page.goto(process.env.RADULATOR_URL || 'http://localhost:5173');
   
@@ -29,18 +39,18 @@ test('Adrenal CT Washout Calculator - {test_data.get("test_name", "Basic Test")}
   await page.click('text="Adrenal Washout CT"');
   
   // Wait for calculator to load
-  await page.waitForSelector('input[name="unenh"]', {{ timeout: 5000 }});
+  await page.waitForSelector('input[name="unenh"]', { timeout: 5000 });
   
   // Fill input fields
-  await page.fill('input[name="unenh"]', '{test_data.get("unenh", "")}');
-  await page.fill('input[name="portal"]', '{test_data.get("portal", "")}');
-  await page.fill('input[name="delayed"]', '{test_data.get("delayed", "")}');
+  await page.fill('input[name="unenh"]', '${unenh}');
+  await page.fill('input[name="portal"]', '${portal}');
+  await page.fill('input[name="delayed"]', '${delayed}');
   
   // Click Calculate button
   await page.click('button:has-text("Calculate")');
   
   // Wait for results
-  await page.waitForSelector('.results', {{ timeout: 2000 }});
+  await page.waitForSelector('.results', { timeout: 2000 });
   
   // Verify results
   const absoluteWashout = await page.locator('text=/Absolute.*Washout/i').locator('..').textContent();
@@ -50,27 +60,26 @@ test('Adrenal CT Washout Calculator - {test_data.get("test_name", "Basic Test")}
   const absValue = parseFloat(absoluteWashout.match(/[0-9.]+/)[0]);
   const relValue = parseFloat(relativeWashout.match(/[0-9.]+/)[0]);
   
-  expect(absValue).toBeCloseTo({test_data.get("expected_absolute", 0)}, 1);
-  expect(relValue).toBeCloseTo({test_data.get("expected_relative", 0)}, 1);
+  expect(absValue).toBeCloseTo(${expected_absolute}, 1);
+  expect(relValue).toBeCloseTo(${expected_relative}, 1);
   
   // Take screenshot for documentation
-  await page.screenshot({{ path: 'test-results/adrenal-ct-washout.png' }});
-}});
-"""
-    
-    # Template for prostate volume
-    elif "prostate" in calculator_name.lower():
-        return f"""const {{ test, expect }} = require('@playwright/test');
+  await page.screenshot({ path: 'test-results/adrenal-ct-washout.png' });
+});
+""")
+
+# Template for prostate volume
+_PROSTATE_TPL = string.Template(r"""const { test, expect } = require('@playwright/test');
 
-test('Prostate Volume Calculator - {test_data.get("test_name", "Basic Test")}', async ({{ page }}) => {{
+test('Prostate Volume Calculator - ${test_name}', async ({ page }) => {
   await page.goto(process.env.RADULATOR_URL || 'http://localhost:5173');
   await page.click('text="Prostate Volume"');
   await page.waitForSelector('input[name="length"]');
   
-  await page.fill('input[name="length"]', '{test_data.get("length", "")}');
-  await page.fill('input[name="height"]', '{test_data.get("height", "")}');
-  await page.fill('input[name="width"]', '{test_data.get("width", "")}');
-  await page.fill('input[name="psa"]', '{test_data.get("psa", "")}');
+  await page.fill('input[name="length"]', '${length}');
+  await page.fill('input[name="height"]', '${height}');
+  await page.fill('input[name="width"]', '${width}');
+  await page.fill('input[name="psa"]', '${psa}');
   
   await page.click('button:has-text("Calculate")');
   await page.waitForSelector('.results');
@@ -81,22 +90,21 @@ test('Prostate Volume Calculator - {test_data.get("test_name", "Basic Test")}',
   const volume = parseFloat(volumeText.match(/[0-9.]+/)[0]);
   const density = parseFloat(densityText.match(/[0-9.]+/)[0]);
   
-  expect(volume).toBeCloseTo({test_data.get("expected_volume", 0)}, 1);
-  expect(density).toBeCloseTo({test_data.get("expected_density", 0)}, 2);
+  expect(volume).toBeCloseTo(${expected_volume}, 1);
+  expect(density).toBeCloseTo(${expected_density}, 2);
   
-  await page.screenshot({{ path: 'test-results/prostate-volume.png' }});
-}});
-"""
-    
-    # Generic template for other calculators
-    else:
-        return f"""const {{ test, expect }} = require('@playwright/test');
+  await page.screenshot({ path: 'test-results/prostate-volume.png' });
+});
+""")
 
-test('{calculator_name} - {test_data.get("test_name", "Basic Test")}', async ({{ page }}) => {{
+# Generic template for other calculators
+_GENERIC_TPL = string.Template(r"""const { test, expect } = require('@playwright/test');
+
+test('${calculator_name} - ${test_name}', async ({ page }) => {
   await page.goto(process.env.RADULATOR_URL || 'http://localhost:5173');
   
   // Select the calculator
-  await page.click('text="{calculator_name}"');
+  await page.click('text="${calculator_name}"');
   
   // Wait for calculator to load
   await page.waitForSelector('button:has-text("Calculate")');
@@ -104,9 +112,60 @@ test('{calculator_name} - {test_data.get("test_name", "Basic Test")}', async ({{
   // TODO: Fill in calculator-specific inputs
   // TODO: Add assertions for expected results
   
-  await page.screenshot({{ path: 'test-results/{calculator_name.lower().replace(" ", "-")}.png' }});
-}});
-"""
+  await page.screenshot({ path: 'test-results/${slug}.png' });
+});
+""")
+
+
+def generate_playwright_test(calculator_name: str, test_data: dict) -> str:
+    """
+    Generate a Playwright test template for a specific calculator.
+    
+    Args:
+        calculator_name: Name of the calculator (e.g., "Adrenal Washout CT")
+        test_data: Dictionary containing test inputs and expected outputs
+    
+    Returns:
+        JavaScript code for the Playwright test
+    """
+    name = calculator_name.lower()
+    
+    if "adrenal" in name and "ct" in name:
+        template = _ADRENAL_CT_TPL
+    elif "prostate" in name:
+        template = _PROSTATE_TPL
+    else:
+        template = _GENERIC_TPL
+    
+    return template.substitute({
+        **_DEFAULTS,
+        **test_data,
+        "calculator_name": calculator_name,
+        "slug": name.replace(" ", "-"),
+    })
+
+
+def run_batch(stream_in, stream_out) -> None:
+    """
+    Generate tests for every NDJSON spec on stream_in in a single process.
+    
+    Args:
+        stream_in: Iterable of NDJSON lines with "calculator_name" and "test_data" keys
+        stream_out: Writable stream receiving one JSON object per input line;
+            bad specs produce {"error": ...} without stopping the batch
+    """
+    import json
+    
+    for line in stream_in:
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+            code = generate_playwright_test(spec["calculator_name"], spec.get("test_data", {}))
+            result = {"calculator_name": spec["calculator_name"], "code": code}
+        except Exception as e:
+            result = {"error": str(e)}
+        stream_out.write(json.dumps(result, separators=(",", ":")) + "\n")
 
 
 def main():
@@ -114,8 +173,13 @@ def main():
     import sys
     import json
     
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        run_batch(sys.stdin, sys.stdout)
+        return
+    
     if len(sys.argv) < 3:
         print("Usage: python generate_playwright_test.py <calculator_name> <test_data_json>")
+        print("       python generate_playwright_test.py --batch < specs.ndjson")
         sys.exit(1)
     
     calculator_name = sys.argv[1]
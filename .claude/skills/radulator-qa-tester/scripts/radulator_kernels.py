@@ -0,0 +1,126 @@
+"""
+Shared Radulator Formula Kernels
+--------------------------------
+Canonical arithmetic for calculators implemented by more than one QA
+script. Kernels take floats and return raw, unrounded values; rounding,
+thresholds and output keys stay with each calling script. dumps() is the
+shared JSON writer for script output.
+
+Used by compute_expected.py and verify_calculators.py.
+"""
+
+import json
+
+_orjson = None
+
+
+def ct_washout(unenh, portal, delayed):
+    """
+    Adrenal CT washout percentages
+    Formula: Absolute = ((portal - delayed) / (portal - unenh)) × 100
+             Relative = ((portal - delayed) / portal) × 100
+    Returns (absolute, relative)
+    """
+    absolute_washout = ((portal - delayed) / (portal - unenh)) * 100
+    relative_washout = ((portal - delayed) / portal) * 100
+    return absolute_washout, relative_washout
+
+
+def chemical_shift(in_phase, out_phase):
+    """
+    Adrenal MRI chemical shift
+    Formula: SII = ((in - out) / in) × 100
+             CSR = in / out
+    Returns (sii, csr)
+    """
+    sii = ((in_phase - out_phase) / in_phase) * 100
+    csr = in_phase / out_phase
+    return sii, csr
+
+
+def prostate_volume_density(length, height, width, psa):
+    """
+    Prostate ellipsoid volume and PSA density
+    Formula: Volume = length × height × width × 0.52
+             PSA Density = PSA / Volume
+    Returns (volume, psa_density)
+    """
+    volume = length * height * width * 0.52
+    psa_density = psa / volume
+    return volume, psa_density
+
+
+def _load_orjson():
+    """Import orjson on first use; False when it is not installed."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson
+
+
+def _prepare(o, ndigits, precision):
+    """
+    Round float leaves to the precision configured for their key and report
+    whether orjson would write the result exactly as json.dumps does: finite
+    floats without an exponent, 64-bit ints, printable ASCII strings.
+    Returns (value, same_as_stdlib).
+    """
+    if isinstance(o, dict):
+        out = {}
+        same = True
+        for k, v in o.items():
+            # Scalars are handled inline; results are mostly flat dicts
+            kind = type(v)
+            if kind is float:
+                nd = precision.get(k)
+                if nd is not None:
+                    v = round(v, nd)
+                same = same and (v == 0 or 1e-4 <= abs(v) < 1e16)
+            elif kind is str:
+                same = same and v.isascii() and v.isprintable()
+            elif kind is int:
+                same = same and -2**63 <= v < 2**63
+            elif kind is not bool and v is not None:
+                v, ok = _prepare(v, precision.get(k), precision)
+                same = same and ok
+            out[k] = v
+        return out, same
+    if isinstance(o, (list, tuple)):
+        out = []
+        same = True
+        for v in o:
+            v, ok = _prepare(v, ndigits, precision)
+            out.append(v)
+            same = same and ok
+        return out, same
+    if isinstance(o, float):
+        if ndigits is not None:
+            o = round(o, ndigits)
+        # NaN fails every comparison, so non-finite values are excluded too
+        return o, o == 0 or 1e-4 <= abs(o) < 1e16
+    if isinstance(o, str):
+        return o, o.isascii() and o.isprintable()
+    if isinstance(o, int) and not isinstance(o, bool):
+        return o, -2**63 <= o < 2**63
+    return o, True
+
+
+def dumps(obj, indent=False, precision=None):
+    """
+    Serialize script output as JSON, rounding floats under keys listed in
+    precision. Compact output is one NDJSON line with "," and ":" separators
+    and uses orjson when it is installed and prints the same text as the
+    stdlib encoder; indented output is written once per run and always uses
+    json, so the CLI never pays for importing orjson.
+    """
+    obj, same = _prepare(obj, None, precision or {})
+    if indent:
+        return json.dumps(obj, indent=2)
+    orjson = _load_orjson()
+    if orjson and same:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
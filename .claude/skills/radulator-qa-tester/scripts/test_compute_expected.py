@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Regression checks for compute_expected.py
+
+Run from the skill directory:
+  python -m unittest discover -s scripts
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import compute_expected
+
+
+def _write_csv(text):
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+    return path
+
+
+class BulkCsvTest(unittest.TestCase):
+    def test_headerless_albi_csv_keeps_every_row(self):
+        path = _write_csv("SI,40,15\nUS,3.5,1.2\n")
+        try:
+            results = compute_expected.run_bulk("albi", path)
+        finally:
+            os.remove(path)
+        self.assertEqual([r["albi_grade"] for r in results], [1, 2])
+
+    def test_header_row_is_skipped(self):
+        path = _write_csv("unit_system,albumin,bilirubin\nSI,40,15\n")
+        try:
+            results = compute_expected.run_bulk("albi", path)
+        finally:
+            os.remove(path)
+        self.assertEqual(len(results), 1)
+
+
+class BulkRowsTest(unittest.TestCase):
+    def test_bad_row_reports_its_index(self):
+        results = compute_expected.run_bulk("prostate", "[[4,3,3.5,2],[0,3,3.5,2],[4,3,3.5,2]]")
+        self.assertEqual(results[1], {"error": "float division by zero", "row": 1})
+        self.assertEqual([r["volume_cm3"] for r in (results[0], results[2])], [21.84, 21.84])
+
+    def test_ragged_row_is_rejected_not_truncated(self):
+        results = compute_expected.run_bulk("adrenal-mri", "[[400,300],[400],[400,300,1]]")
+        self.assertNotIn("error", results[0])
+        self.assertEqual(results[1], {"error": "Expected 2 values, got 1", "row": 1})
+        self.assertEqual(results[2], {"error": "Expected 2 values, got 3", "row": 2})
+
+
+class ParseArgsTest(unittest.TestCase):
+    def test_blank_optional_size_uses_default(self):
+        args = compute_expected.parse_args("milan", ["2", "2.5", "no", "no", "", "2"])
+        self.assertEqual(args, (2, 2.5, "no", "no", None, 2.0))
+
+    def test_invalid_number_still_rejected(self):
+        with self.assertRaises(ValueError):
+            compute_expected.parse_args("milan", ["2", "2.5", "no", "no", "abc"])
+
+    def test_negative_number_is_not_an_option(self):
+        args = compute_expected.parse_args("adrenal-ct", ["-1e-7", "100", "40"])
+        self.assertEqual(args, (-1e-7, 100.0, 40.0))
+
+
+class ConvertArgsTest(unittest.TestCase):
+    def test_null_optional_from_ndjson_uses_default(self):
+        args = compute_expected.convert_args("milan", [2, 2.5, None, None, None, 2])
+        self.assertEqual(args, (2, 2.5, "no", "no", None, 2.0))
+
+    def test_negative_number_is_a_value(self):
+        args = compute_expected.convert_args("adrenal-ct", [-1e-7, 100, 40])
+        self.assertEqual(args, (-1e-7, 100.0, 40.0))
+
+    def test_help_flag_is_data_not_an_exit(self):
+        with self.assertRaises(ValueError):
+            compute_expected.convert_args("adrenal-ct", ["-h", 100, 40])
+
+    def test_missing_and_extra_values_rejected(self):
+        with self.assertRaisesRegex(ValueError, "required: delayed"):
+            compute_expected.convert_args("adrenal-ct", [1, 100])
+        with self.assertRaisesRegex(ValueError, "unrecognized"):
+            compute_expected.convert_args("adrenal-ct", [1, 100, 40, 5])
+
+    def test_variadic_answers(self):
+        args = compute_expected.convert_args("shim", [5, 5, 5, 5, 5])
+        self.assertEqual(args, (5, 5, 5, 5, 5))
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, value in (
+            ("_CACHE_PATH", os.path.join(self.tmp.name, "expected.json")),
+            ("_DISK_CACHE_MAX", 3),
+        ):
+            patcher = mock.patch.object(compute_expected, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self._reset()
+        self.addCleanup(self._reset)
+        # Keep _load_disk_cache from registering a save of the temp cache at exit
+        patcher = mock.patch.object(compute_expected.atexit, "register")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _reset(self):
+        compute_expected._disk_cache = None
+        compute_expected._disk_cache_dirty = False
+        compute_expected._fingerprint = None
+
+    def _fill(self, *volumes):
+        for v in volumes:
+            compute_expected.compute("adrenal-mri", (float(v), 100.0))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = compute_expected._load_disk_cache()
+        self._fill(400, 300, 200)
+        self._fill(400)  # hit: 300 is now the least recently used
+        self._fill(500)
+        self.assertEqual(
+            [r["chemical_shift_ratio"] for r in cache.values()],
+            [2.0, 4.0, 5.0],
+        )
+
+    def test_hits_do_not_mark_cache_dirty(self):
+        compute_expected._load_disk_cache()
+        self._fill(400)
+        compute_expected._save_disk_cache()
+        compute_expected._disk_cache_dirty = False
+        self._fill(400)
+        self.assertFalse(compute_expected._disk_cache_dirty)
+
+    def test_fingerprint_change_discards_cache(self):
+        compute_expected._load_disk_cache()
+        self._fill(400)
+        compute_expected._save_disk_cache()
+
+        self._reset()
+        self.assertEqual(len(compute_expected._load_disk_cache()), 1)
+
+        self._reset()
+        with mock.patch.object(compute_expected, "_source_fingerprint", return_value="changed"):
+            self.assertEqual(compute_expected._load_disk_cache(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,20 @@ Radulator Calculator Verification Script
 
 This script computes expected values for all six Radulator calculators
 to verify that the web app produces correct results.
+
+Batch mode reads NDJSON test cases from stdin, one per line:
+    {"calculator": "adrenal_ct_washout", "test_case": {"unenh": 10, ...}}
+and writes one JSON result per line to stdout.
 """
 
 import json
 import sys
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import radulator_kernels as kernels
+except ImportError:  # imported as scripts.verify_calculators
+    from . import radulator_kernels as kernels
 
 
 def adrenal_ct_washout(unenh: float, portal: float, delayed: float) -> Dict[str, Any]:
@@ -23,8 +32,7 @@ def adrenal_ct_washout(unenh: float, portal: float, delayed: float) -> Dict[str,
     Returns:
         Dictionary with absolute_washout, relative_washout, and interpretation
     """
-    absolute_washout = ((portal - delayed) / (portal - unenh)) * 100
-    relative_washout = ((portal - delayed) / portal) * 100
+    absolute_washout, relative_washout = kernels.ct_washout(unenh, portal, delayed)
     
     # Interpretation thresholds: Absolute > 60%, Relative > 40%
     if absolute_washout > 60 and relative_washout > 40:
@@ -50,8 +58,7 @@ def adrenal_mri_chemical_shift(in_phase: float, out_phase: float) -> Dict[str, A
     Returns:
         Dictionary with SII, CSR, and interpretation
     """
-    sii = ((in_phase - out_phase) / in_phase) * 100
-    csr = in_phase / out_phase
+    sii, csr = kernels.chemical_shift(in_phase, out_phase)
     
     # Interpretation threshold: SII > 16.5%
     if sii > 16.5:
@@ -79,8 +86,7 @@ def prostate_volume_psa_density(length: float, height: float, width: float, psa:
     Returns:
         Dictionary with volume, psa_density, and interpretation
     """
-    volume = length * height * width * 0.52
-    psa_density = psa / volume
+    volume, psa_density = kernels.prostate_volume_density(length, height, width, psa)
     
     # Interpretation threshold: PSA density < 0.15 ng/mL²
     if psa_density < 0.15:
@@ -199,6 +205,23 @@ def hip_dysplasia_indices(alpha_angle: float, beta_angle: float, femoral_coverag
     }
 
 
+# Calculator name -> (function, required test_case keys, optional keys with defaults)
+_VERIFY_DISPATCH: Dict[str, Tuple[Callable[..., Dict[str, Any]], Tuple[str, ...], Dict[str, Any]]] = {
+    "adrenal_ct_washout": (adrenal_ct_washout, ("unenh", "portal", "delayed"), {}),
+    "adrenal_mri_chemical_shift": (adrenal_mri_chemical_shift, ("in_phase", "out_phase"), {}),
+    "prostate_volume": (prostate_volume_psa_density, ("length", "height", "width", "psa"), {}),
+    "renal_cyst": (renal_cyst_bosniak, (), {
+        "homogeneous": False,
+        "thin_wall": False,
+        "no_septa_calc_enhancement": False,
+        "thickened_walls": False,
+        "measurable_enhancement": False,
+    }),
+    "spleen_size": (spleen_size, ("length", "age", "sex"), {}),
+    "hip_dysplasia": (hip_dysplasia_indices, ("alpha_angle", "beta_angle", "femoral_coverage"), {}),
+}
+
+
 def run_test_case(calculator: str, test_case: Dict[str, Any]) -> Dict[str, Any]:
     """
     Run a test case for a specific calculator.
@@ -210,59 +233,46 @@ def run_test_case(calculator: str, test_case: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with expected outputs
     """
-    if calculator == "adrenal_ct_washout":
-        return adrenal_ct_washout(
-            test_case["unenh"],
-            test_case["portal"],
-            test_case["delayed"]
-        )
-    elif calculator == "adrenal_mri_chemical_shift":
-        return adrenal_mri_chemical_shift(
-            test_case["in_phase"],
-            test_case["out_phase"]
-        )
-    elif calculator == "prostate_volume":
-        return prostate_volume_psa_density(
-            test_case["length"],
-            test_case["height"],
-            test_case["width"],
-            test_case["psa"]
-        )
-    elif calculator == "renal_cyst":
-        return renal_cyst_bosniak(
-            test_case.get("homogeneous", False),
-            test_case.get("thin_wall", False),
-            test_case.get("no_septa_calc_enhancement", False),
-            test_case.get("thickened_walls", False),
-            test_case.get("measurable_enhancement", False)
-        )
-    elif calculator == "spleen_size":
-        return spleen_size(
-            test_case["length"],
-            test_case["age"],
-            test_case["sex"]
-        )
-    elif calculator == "hip_dysplasia":
-        return hip_dysplasia_indices(
-            test_case["alpha_angle"],
-            test_case["beta_angle"],
-            test_case["femoral_coverage"]
-        )
-    else:
+    if calculator not in _VERIFY_DISPATCH:
         raise ValueError(f"Unknown calculator: {calculator}")
+    
+    func, required, optional = _VERIFY_DISPATCH[calculator]
+    kwargs = {key: test_case[key] for key in required}
+    kwargs.update({key: test_case.get(key, default) for key, default in optional.items()})
+    return func(**kwargs)
+
+
+def run_batch(stream_in, stream_out) -> None:
+    """
+    Run NDJSON test cases in-process.
+    
+    Args:
+        stream_in: Iterable of NDJSON lines with "calculator" and "test_case" keys
+        stream_out: Writable stream receiving one JSON result per input line
+    """
+    for line in stream_in:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            result = run_test_case(req["calculator"], req["test_case"])
+        except Exception as e:
+            result = {"error": str(e)}
+        stream_out.write(kernels.dumps(result) + "\n")
 
 
 def main():
     """Main entry point for the script."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        run_batch(sys.stdin, sys.stdout)
+        return
+
     if len(sys.argv) < 2:
         print("Usage: python verify_calculators.py <calculator_name> [test_case_json]")
+        print("       python verify_calculators.py --batch < cases.ndjson")
         print("\nAvailable calculators:")
-        print("  - adrenal_ct_washout")
-        print("  - adrenal_mri_chemical_shift")
-        print("  - prostate_volume")
-        print("  - renal_cyst")
-        print("  - spleen_size")
-        print("  - hip_dysplasia")
+        for name in _VERIFY_DISPATCH:
+            print(f"  - {name}")
         sys.exit(1)
     
     calculator = sys.argv[1]
@@ -271,7 +281,7 @@ def main():
         # Test case provided as JSON
         test_case = json.loads(sys.argv[2])
         result = run_test_case(calculator, test_case)
-        print(json.dumps(result, indent=2))
+        print(kernels.dumps(result, indent=True))
     else:
         # Run default test cases
         print(f"Running default test cases for {calculator}...")